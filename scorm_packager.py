@@ -0,0 +1,973 @@
+"""
+SCORM Package Builder
+Generates the SCORM 1.2 files (manifest, API wrapper and launcher page) and zips them.
+
+This lives outside the Streamlit script on purpose: Streamlit re-executes the
+script on every rerun, but an imported module's top-level setup (templates, the
+prebuilt base archive) runs only once per process.
+"""
+
+import streamlit as st
+import zipfile
+import io
+import string
+from functools import lru_cache
+from typing import BinaryIO, Iterator
+
+# Fixed ZIP entry timestamp (the earliest the format allows) for reproducible packages
+_ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+class _SanitizeTable(dict):
+    """str.translate table that drops anything but word chars, whitespace and dashes.
+
+    Entries are filled in lazily so arbitrary Unicode titles are covered without
+    building a table for every code point up front.
+    """
+
+    def __missing__(self, codepoint: int):
+        char = chr(codepoint)
+        keep = char.isalnum() or char.isspace() or char in '_-'
+        self[codepoint] = result = char if keep else None
+        return result
+
+
+_SANITIZE_TABLE = _SanitizeTable()
+
+
+class _ByteTemplate:
+    """string.Template-style $placeholder template that renders straight to UTF-8.
+
+    The literal text between placeholders is split out and encoded once, so
+    rendering is a bytes join rather than a regex pass over the whole template
+    followed by an encode.
+    """
+
+    def __init__(self, template: str):
+        self._literals = []  # encoded text preceding each placeholder
+        self._names = []
+        pending = []
+        pos = 0
+        for match in string.Template.pattern.finditer(template):
+            pending.append(template[pos:match.start()])
+            pos = match.end()
+            if match.group('escaped') is not None:
+                pending.append('$')
+                continue
+            name = match.group('named') or match.group('braced')
+            if name is None:
+                raise ValueError(f"Invalid placeholder in template: {match.group()!r}")
+            self._literals.append(''.join(pending).encode('utf-8'))
+            self._names.append(name)
+            pending = []
+        pending.append(template[pos:])
+        self._tail = ''.join(pending).encode('utf-8')
+
+    def render(self, **values) -> bytes:
+        parts = []
+        for literal, name in zip(self._literals, self._names):
+            parts.append(literal)
+            parts.append(str(values[name]).encode('utf-8'))
+        parts.append(self._tail)
+        return b''.join(parts)
+
+def sanitize_filename(name: str) -> str:
+    """Convert course name to safe filename."""
+    # Fast path: plain ASCII titles with nothing to strip, checked entirely in C
+    if name.isascii() and name.replace(' ', '').replace('-', '').replace('_', '').isalnum():
+        return '_'.join(name.split())[:50]
+
+    # Remove special characters, replace spaces with underscores
+    safe = name.translate(_SANITIZE_TABLE)
+    safe = '_'.join(safe.split())
+    # Titles made only of punctuation would otherwise leave an empty identifier
+    return safe[:50] or 'course'  # Limit length
+
+# imsmanifest.xml; placeholders are filled in by generate_manifest
+_MANIFEST_TEMPLATE = _ByteTemplate('''<?xml version="1.0" encoding="UTF-8"?>
+<manifest identifier="$course_id" version="1.0"
+    xmlns="http://www.imsproject.org/xsd/imscp_rootv1p1p2"
+    xmlns:adlcp="http://www.adlnet.org/xsd/adlcp_rootv1p2"
+    xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
+    xsi:schemaLocation="http://www.imsproject.org/xsd/imscp_rootv1p1p2 imscp_rootv1p1p2.xsd
+                        http://www.imsglobal.org/xsd/imsmd_rootv1p2p1 imsmd_rootv1p2p1.xsd
+                        http://www.adlnet.org/xsd/adlcp_rootv1p2 adlcp_rootv1p2.xsd">
+
+    <metadata>
+        <schema>ADL SCORM</schema>
+        <schemaversion>1.2</schemaversion>
+    </metadata>
+
+    <organizations default="org1">
+        <organization identifier="org1">
+            <title>$course_title</title>
+            <item identifier="item1" identifierref="resource1">
+                <title>$course_title</title>
+                <adlcp:masteryscore>$mastery_score</adlcp:masteryscore>
+            </item>
+        </organization>
+    </organizations>
+
+    <resources>
+        <resource identifier="resource1" type="webcontent" adlcp:scormtype="sco" href="index.html">
+            <file href="index.html"/>
+            <file href="scormapi.js"/>
+        </resource>
+    </resources>
+</manifest>''')
+
+def generate_manifest(course_id: str, course_title: str, mastery_score: int) -> bytes:
+    """Generate imsmanifest.xml content as UTF-8."""
+    return _MANIFEST_TEMPLATE.render(course_id=course_id, course_title=course_title,
+                                     mastery_score=mastery_score)
+
+# Static scormapi.js content; it has no per-package parameters
+_SCORM_API_JS = '''/**
+ * SCORM 1.2 API Wrapper
+ * Handles communication between the course content and the LMS
+ */
+
+var SCORM = {
+    API: null,
+    isInitialized: false,
+
+    findAPI: function(win) {
+        var attempts = 0;
+        var maxAttempts = 500;
+
+        while ((!win.API) && (win.parent) && (win.parent != win) && (attempts < maxAttempts)) {
+            attempts++;
+            win = win.parent;
+        }
+
+        if (win.API) {
+            return win.API;
+        }
+
+        if (win.opener && win.opener.API) {
+            return win.opener.API;
+        }
+
+        if (win.opener) {
+            return this.findAPI(win.opener);
+        }
+
+        return null;
+    },
+
+    init: function() {
+        this.API = this.findAPI(window);
+
+        if (this.API) {
+            var result = this.API.LMSInitialize("");
+            if (result === "true" || result === true) {
+                this.isInitialized = true;
+                this.setStatus("incomplete");
+                console.log("SCORM: Successfully initialized");
+                return true;
+            }
+        }
+
+        console.log("SCORM: Could not initialize - API not found or initialization failed");
+        return false;
+    },
+
+    setStatus: function(status) {
+        if (this.isInitialized && this.API) {
+            this.API.LMSSetValue("cmi.core.lesson_status", status);
+            this.API.LMSCommit("");
+        }
+    },
+
+    setScore: function(score) {
+        if (this.isInitialized && this.API) {
+            this.API.LMSSetValue("cmi.core.score.raw", score);
+            this.API.LMSSetValue("cmi.core.score.min", "0");
+            this.API.LMSSetValue("cmi.core.score.max", "100");
+            this.API.LMSCommit("");
+        }
+    },
+
+    complete: function() {
+        this.setStatus("completed");
+        this.setScore(100);
+        console.log("SCORM: Course marked as completed");
+    },
+
+    pass: function() {
+        this.setStatus("passed");
+        this.setScore(100);
+        console.log("SCORM: Course marked as passed");
+    },
+
+    finish: function() {
+        if (this.isInitialized && this.API) {
+            this.API.LMSCommit("");
+            this.API.LMSFinish("");
+            this.isInitialized = false;
+            console.log("SCORM: Session terminated");
+        }
+    },
+
+    getValue: function(element) {
+        if (this.isInitialized && this.API) {
+            return this.API.LMSGetValue(element);
+        }
+        return "";
+    },
+
+    setValue: function(element, value) {
+        if (this.isInitialized && this.API) {
+            this.API.LMSSetValue(element, value);
+            this.API.LMSCommit("");
+        }
+    }
+};
+
+window.onload = function() {
+    SCORM.init();
+};
+
+window.onunload = function() {
+    SCORM.finish();
+};
+
+window.onbeforeunload = function() {
+    SCORM.finish();
+};'''
+
+_SCORM_API_BYTES = _SCORM_API_JS.encode('utf-8')
+
+def generate_scorm_api() -> str:
+    """Generate scormapi.js content."""
+    return _SCORM_API_JS
+
+# index.html launcher page; placeholders are filled in by generate_html
+_HTML_TEMPLATE = _ByteTemplate('''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>$course_title</title>
+    <script src="scormapi.js"></script>
+    <style>
+        * {
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }
+
+        html, body {
+            width: 100%;
+            height: 100%;
+            font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
+            background: #f5f5f7;
+        }
+
+        .container {
+            display: flex;
+            flex-direction: column;
+            align-items: center;
+            justify-content: center;
+            min-height: 100vh;
+            padding: 40px 20px;
+        }
+
+        .card {
+            background: white;
+            border-radius: 8px;
+            box-shadow: 0 2px 8px rgba(0, 0, 0, 0.08);
+            padding: 48px;
+            max-width: 700px;
+            width: 100%;
+            text-align: center;
+            border-top: 4px solid $primary_color;
+        }
+
+        .logo {
+            width: 60px;
+            height: 60px;
+            background: $primary_color;
+            border-radius: 4px;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            margin: 0 auto 24px;
+        }
+
+        .logo svg {
+            width: 32px;
+            height: 32px;
+            fill: white;
+        }
+
+        h1 {
+            color: #1a1a1a;
+            font-size: 26px;
+            margin-bottom: 12px;
+            font-weight: 600;
+            letter-spacing: -0.02em;
+        }
+
+        .subtitle {
+            color: #666666;
+            font-size: 15px;
+            margin-bottom: 20px;
+            line-height: 1.5;
+            font-weight: 400;
+        }
+
+        .additional-info {
+            background: #fafafa;
+            border: 1px solid #e0e0e0;
+            border-left: 3px solid $primary_color;
+            padding: 20px;
+            border-radius: 4px;
+            margin-bottom: 28px;
+            text-align: left;
+            color: #333333;
+            font-size: 13px;
+            line-height: 1.7;
+        }
+
+        .additional-info p {
+            margin: 0 0 10px 0;
+        }
+
+        .additional-info p:last-child {
+            margin-bottom: 0;
+        }
+
+        .btn {
+            display: inline-block;
+            padding: 12px 28px;
+            border: none;
+            border-radius: 4px;
+            cursor: pointer;
+            font-size: 14px;
+            font-weight: 500;
+            text-decoration: none;
+            transition: all 0.2s ease;
+            margin: 6px;
+            letter-spacing: 0.01em;
+        }
+
+        .btn-primary {
+            background: $primary_color;
+            color: white;
+        }
+
+        .btn-primary:hover {
+            background: $darker;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.15);
+        }
+
+        .btn-success {
+            background: #00B06B;
+            color: white;
+        }
+
+        .btn-success:hover {
+            background: #009959;
+        }
+
+        .btn-success:disabled {
+            background: #cccccc;
+            cursor: not-allowed;
+        }
+
+        .btn-secondary {
+            background: #ffffff;
+            color: #333333;
+            border: 1px solid #d1d1d1;
+        }
+
+        .btn-secondary:hover {
+            background: #f5f5f5;
+            border-color: #b3b3b3;
+        }
+
+        .status-grid {
+            display: grid;
+            grid-template-columns: 1fr 1fr;
+            gap: 16px;
+            margin: 32px 0;
+        }
+
+        .status-box {
+            background: #fafafa;
+            border-radius: 4px;
+            padding: 20px;
+            border: 1px solid #e5e5e5;
+            border-left: 3px solid $primary_color;
+        }
+
+        .status-box.time {
+            border-left-color: #FF9500;
+        }
+
+        .status-box.total-time {
+            border-left-color: #00B06B;
+        }
+
+        .status-label {
+            font-size: 11px;
+            text-transform: uppercase;
+            letter-spacing: 0.5px;
+            color: #888888;
+            margin-bottom: 8px;
+            font-weight: 500;
+        }
+
+        .status-value {
+            font-size: 16px;
+            font-weight: 600;
+            color: #1a1a1a;
+        }
+
+        .status-value.completed {
+            color: #00B06B;
+        }
+
+        .time-display {
+            font-family: 'SF Mono', 'Monaco', 'Consolas', monospace;
+            font-size: 20px;
+            color: #FF9500;
+            font-weight: 500;
+        }
+
+        .total-time-display {
+            font-family: 'SF Mono', 'Monaco', 'Consolas', monospace;
+            font-size: 20px;
+            color: #00B06B;
+            font-weight: 500;
+        }
+
+        .instructions {
+            background: #f9f9f9;
+            border: 1px solid #e0e0e0;
+            border-radius: 4px;
+            padding: 24px;
+            margin-top: 28px;
+            text-align: left;
+        }
+
+        .instructions h3 {
+            color: #1a1a1a;
+            font-size: 14px;
+            margin-bottom: 12px;
+            font-weight: 600;
+        }
+
+        .instructions ol {
+            color: #4d4d4d;
+            font-size: 13px;
+            padding-left: 20px;
+            line-height: 1.7;
+        }
+
+        .button-group {
+            margin-top: 25px;
+        }
+
+        .course-opened {
+            display: none;
+        }
+
+        .course-opened.show {
+            display: block;
+        }
+
+        .initial-state.hide {
+            display: none;
+        }
+
+        .timer-notice {
+            background: #f0f4ff;
+            border: 1px solid #d0d9f5;
+            border-radius: 4px;
+            padding: 16px;
+            margin-top: 24px;
+            font-size: 13px;
+            color: #334155;
+        }
+
+        .timer-active {
+            display: inline-block;
+            width: 8px;
+            height: 8px;
+            background: #00B06B;
+            border-radius: 50%;
+            margin-right: 8px;
+            animation: pulse 2s infinite;
+        }
+
+        .timer-paused {
+            display: inline-block;
+            width: 8px;
+            height: 8px;
+            background: #FF9500;
+            border-radius: 50%;
+            margin-right: 8px;
+        }
+
+        @keyframes pulse {
+            0%, 100% { opacity: 1; }
+            50% { opacity: 0.4; }
+        }
+
+        .progress-bar-container {
+            background: #e5e5e5;
+            border-radius: 2px;
+            height: 6px;
+            margin-top: 12px;
+            overflow: hidden;
+        }
+
+        .progress-bar {
+            background: $primary_color;
+            height: 100%;
+            border-radius: 2px;
+            transition: width 0.5s ease;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="card">
+            <div class="logo">
+                <svg viewBox="0 0 24 24" xmlns="http://www.w3.org/2000/svg">
+                    <path d="M12 2L4 6v6c0 5.55 3.84 10.74 8 12 4.16-1.26 8-6.45 8-12V6l-8-4zm0 2.18l6 3v4.82c0 4.52-2.98 8.69-6 9.88-3.02-1.19-6-5.36-6-9.88V7.18l6-3z"/>
+                </svg>
+            </div>
+            <h1>$course_title</h1>
+            <p class="subtitle">$subtitle_html</p>
+            $additional_info_html
+
+            <div class="status-grid">
+                <div class="status-box">
+                    <div class="status-label">Course Status</div>
+                    <div class="status-value" id="statusValue">Not Started</div>
+                </div>
+                <div class="status-box time">
+                    <div class="status-label"><span class="timer-paused" id="timerIndicator"></span>Session Time</div>
+                    <div class="time-display" id="sessionTime">00:00:00</div>
+                </div>
+            </div>
+
+            <div class="status-box total-time" style="margin-bottom: 20px;">
+                <div class="status-label">Total Time on Course</div>
+                <div class="total-time-display" id="totalTime">00:00:00</div>
+                <div class="progress-bar-container">
+                    <div class="progress-bar" id="progressBar" style="width: 0%"></div>
+                </div>
+            </div>
+
+            <div id="initialState" class="initial-state">
+                <button class="btn btn-primary" onclick="launchCourse()">
+                    Launch Course ↗
+                </button>
+
+                <div class="instructions">
+                    <h3>Instructions:</h3>
+                    <ol>
+                        <li>Click "Launch Course" to open the training in a new tab</li>
+                        <li>Complete the course in the new tab</li>
+                        <li>Keep this window open - it tracks your time</li>
+                        <li>Return here and click "Mark Complete" when finished</li>
+                    </ol>
+                </div>
+            </div>
+
+            <div id="courseOpened" class="course-opened">
+                <div class="timer-notice">
+                    <span class="timer-active" id="activeIndicator"></span>
+                    <strong>Timer is running.</strong> Keep this window open while completing the course.
+                </div>
+
+                <div class="button-group">
+                    <button class="btn btn-primary" onclick="launchCourse()">
+                        Reopen Course ↗
+                    </button>
+                    <button class="btn btn-success" id="completeBtn" onclick="markComplete()">
+                        ✓ Mark Complete
+                    </button>
+                    <button class="btn btn-secondary" onclick="exitCourse()">
+                        Exit Course
+                    </button>
+                </div>
+            </div>
+        </div>
+    </div>
+
+    <script>
+        var courseWindow = null;
+        var courseURL = "$course_url";
+        var EXPECTED_DURATION = $expected_seconds;
+        $min_time_js
+
+        var sessionStartTime = null;
+        var sessionSeconds = 0;
+        var totalSeconds = 0;
+        var timerInterval = null;
+        var isTimerRunning = false;
+
+        function formatTime(seconds) {
+            var hrs = Math.floor(seconds / 3600);
+            var mins = Math.floor((seconds % 3600) / 60);
+            var secs = seconds % 60;
+            return String(hrs).padStart(2, '0') + ':' +
+                   String(mins).padStart(2, '0') + ':' +
+                   String(secs).padStart(2, '0');
+        }
+
+        function formatScormTime(seconds) {
+            var hrs = Math.floor(seconds / 3600);
+            var mins = Math.floor((seconds % 3600) / 60);
+            var secs = seconds % 60;
+            return String(hrs).padStart(4, '0') + ':' +
+                   String(mins).padStart(2, '0') + ':' +
+                   String(secs).padStart(2, '0') + '.00';
+        }
+
+        function parseScormTime(timeStr) {
+            if (!timeStr || timeStr === '') return 0;
+            var parts = timeStr.split(':');
+            if (parts.length >= 3) {
+                var hrs = parseInt(parts[0], 10) || 0;
+                var mins = parseInt(parts[1], 10) || 0;
+                var secs = parseFloat(parts[2]) || 0;
+                return hrs * 3600 + mins * 60 + Math.floor(secs);
+            }
+            return 0;
+        }
+
+        function updateTimerDisplay() {
+            document.getElementById('sessionTime').textContent = formatTime(sessionSeconds);
+            document.getElementById('totalTime').textContent = formatTime(totalSeconds);
+
+            var progress = Math.min((totalSeconds / EXPECTED_DURATION) * 100, 100);
+            document.getElementById('progressBar').style.width = progress + '%';
+        }
+
+        function startTimer() {
+            if (isTimerRunning) return;
+
+            isTimerRunning = true;
+            sessionStartTime = Date.now();
+
+            var indicator = document.getElementById('timerIndicator');
+            indicator.className = 'timer-active';
+
+            timerInterval = setInterval(function() {
+                sessionSeconds++;
+                totalSeconds++;
+                updateTimerDisplay();
+
+                if (sessionSeconds % 30 === 0) {
+                    commitTimeToScorm();
+                }
+            }, 1000);
+        }
+
+        function pauseTimer() {
+            if (!isTimerRunning) return;
+
+            isTimerRunning = false;
+            clearInterval(timerInterval);
+
+            var indicator = document.getElementById('timerIndicator');
+            indicator.className = 'timer-paused';
+
+            commitTimeToScorm();
+        }
+
+        function commitTimeToScorm() {
+            if (SCORM.isInitialized) {
+                SCORM.setValue('cmi.core.session_time', formatScormTime(sessionSeconds));
+                SCORM.setValue('cmi.suspend_data', JSON.stringify({
+                    totalTime: totalSeconds,
+                    lastAccess: new Date().toISOString()
+                }));
+            }
+        }
+
+        function loadTimeFromScorm() {
+            if (SCORM.isInitialized) {
+                var suspendData = SCORM.getValue('cmi.suspend_data');
+                if (suspendData && suspendData !== '') {
+                    try {
+                        var data = JSON.parse(suspendData);
+                        if (data.totalTime) {
+                            totalSeconds = data.totalTime;
+                            updateTimerDisplay();
+                        }
+                    } catch (e) {
+                        console.log('Could not parse suspend_data');
+                    }
+                }
+
+                var totalTimeStr = SCORM.getValue('cmi.core.total_time');
+                if (totalTimeStr && totalTimeStr !== '') {
+                    var prevTotal = parseScormTime(totalTimeStr);
+                    if (prevTotal > totalSeconds) {
+                        totalSeconds = prevTotal;
+                        updateTimerDisplay();
+                    }
+                }
+            }
+        }
+
+        function launchCourse() {
+            courseWindow = window.open(courseURL, '_blank');
+
+            document.getElementById('initialState').classList.add('hide');
+            document.getElementById('courseOpened').classList.add('show');
+
+            updateStatus('In Progress');
+            SCORM.setStatus('incomplete');
+            startTimer();
+        }
+
+        function markComplete() {
+            $min_time_check
+            if (confirm('Are you sure you want to mark this course as complete?\\n\\nTotal time: ' + formatTime(totalSeconds))) {
+                pauseTimer();
+                commitTimeToScorm();
+                SCORM.complete();
+                updateStatus('Completed', true);
+                alert('Course has been marked as complete!\\nTotal time recorded: ' + formatTime(totalSeconds));
+            }
+        }
+
+        function exitCourse() {
+            var statusValue = document.getElementById('statusValue').textContent;
+
+            if (statusValue !== 'Completed') {
+                if (!confirm('You have not marked the course as complete.\\nYour time (' + formatTime(totalSeconds) + ') will be saved.\\n\\nAre you sure you want to exit?')) {
+                    return;
+                }
+            }
+
+            pauseTimer();
+            commitTimeToScorm();
+
+            if (courseWindow && !courseWindow.closed) {
+                courseWindow.close();
+            }
+
+            SCORM.finish();
+            window.close();
+
+            setTimeout(function() {
+                alert('Please close this window to return to your LMS.');
+            }, 500);
+        }
+
+        function updateStatus(status, isCompleted) {
+            var statusElement = document.getElementById('statusValue');
+            statusElement.textContent = status;
+
+            if (isCompleted) {
+                statusElement.classList.add('completed');
+            }
+        }
+
+        document.addEventListener('visibilitychange', function() {
+            if (!document.hidden) {
+                if (document.getElementById('courseOpened').classList.contains('show') && !isTimerRunning) {
+                    startTimer();
+                }
+            }
+        });
+
+        window.addEventListener('load', function() {
+            setTimeout(function() {
+                if (SCORM.isInitialized) {
+                    loadTimeFromScorm();
+
+                    var prevStatus = SCORM.getValue('cmi.core.lesson_status');
+                    if (prevStatus === 'completed' || prevStatus === 'passed') {
+                        updateStatus('Completed', true);
+                        document.getElementById('initialState').classList.add('hide');
+                        document.getElementById('courseOpened').classList.add('show');
+                    } else if (prevStatus === 'incomplete') {
+                        updateStatus('In Progress');
+                        document.getElementById('initialState').classList.add('hide');
+                        document.getElementById('courseOpened').classList.add('show');
+                        startTimer();
+                    }
+                }
+                updateTimerDisplay();
+            }, 500);
+        });
+
+        window.addEventListener('beforeunload', function() {
+            pauseTimer();
+            commitTimeToScorm();
+        });
+    </script>
+</body>
+</html>''')
+
+# Guard inserted at the top of markComplete() when a minimum time is required
+_MIN_TIME_CHECK_TEMPLATE = string.Template('''
+            if (totalSeconds < MIN_TIME_REQUIRED) {
+                var remaining = MIN_TIME_REQUIRED - totalSeconds;
+                alert('You need to spend at least $min_time_minutes minutes on this course before marking it complete.\\n\\nTime remaining: ' + formatTime(remaining));
+                return;
+            }''')
+
+@lru_cache(maxsize=64)
+def _darker_shade(primary_color: str) -> str:
+    """Return a darker shade of a #rrggbb color for hover states."""
+    # Convert hex color to RGB for gradient
+    rgb = int(primary_color.lstrip('#'), 16)
+    r, g, b = (rgb >> 16) & 0xFF, (rgb >> 8) & 0xFF, rgb & 0xFF
+    # Create a darker shade for gradient
+    return f"#{max(0,r-40):02x}{max(0,g-40):02x}{max(0,b-40):02x}"
+
+def generate_html(course_title: str, course_url: str, primary_color: str,
+                  expected_duration: int, require_min_time: bool, min_time_minutes: int,
+                  subtitle: str = "", additional_info: str = "") -> bytes:
+    """Generate index.html content with time tracking, as UTF-8."""
+
+    darker = _darker_shade(primary_color)
+
+    min_time_js = ""
+    min_time_check = ""
+    if require_min_time:
+        min_time_seconds = min_time_minutes * 60
+        min_time_js = f"var MIN_TIME_REQUIRED = {min_time_seconds};"
+        min_time_check = _MIN_TIME_CHECK_TEMPLATE.substitute(min_time_minutes=min_time_minutes)
+
+    subtitle_text = subtitle or 'External Course with Time Tracking'
+    info_block = f'<div class="additional-info">{additional_info}</div>' if additional_info else ''
+
+    return _HTML_TEMPLATE.render(
+        course_title=course_title,
+        course_url=course_url,
+        primary_color=primary_color,
+        darker=darker,
+        expected_seconds=expected_duration * 60,
+        min_time_js=min_time_js,
+        min_time_check=min_time_check,
+        subtitle_html=subtitle_text,
+        additional_info_html=info_block,
+    )
+
+class _ChunkWriter:
+    """Write-only file object that collects ZIP output so it can be streamed."""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> list:
+        """Return and forget everything written since the last drain."""
+        chunks, self._chunks = self._chunks, []
+        return chunks
+
+def _write_entry(zip_file: zipfile.ZipFile, filename: str, data: bytes,
+                 compresslevel: int = 1) -> None:
+    """Add a DEFLATE-compressed member with a fixed timestamp.
+
+    A fixed date_time skips the localtime() lookup and makes identical inputs
+    produce byte-identical packages. Level 1 keeps most of the ratio on these
+    small text files at a fraction of the CPU.
+    """
+    info = zipfile.ZipInfo(filename, date_time=_ZIP_DATE_TIME)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    info.external_attr = 0o600 << 16  # same permissions writestr() gives a plain name
+    zip_file.writestr(info, data, compresslevel=compresslevel)
+
+def _build_base_zip() -> bytes:
+    """Build the ZIP skeleton shared by every package: just the static scormapi.js."""
+    zip_buffer = io.BytesIO()
+    with zipfile.ZipFile(zip_buffer, 'w') as zip_file:
+        # Only built once, so spend the CPU on the best ratio
+        _write_entry(zip_file, 'scormapi.js', _SCORM_API_BYTES, compresslevel=9)
+    return zip_buffer.getvalue()
+
+# Built once per process so package builds only compress the per-course entries.
+# The scormapi.js CRC and DEFLATE stream are computed here and copied verbatim by
+# create_scorm_package(); iter_scorm_package() still recompresses it because
+# zipfile has no public way to splice a precompressed member into a new archive,
+# and a STORED member would lose its sizes behind the data descriptor.
+_BASE_ZIP_BYTES = _build_base_zip()
+
+def _package_entries(course_title: str, course_url: str, primary_color: str,
+                     mastery_score: int, expected_duration: int,
+                     require_min_time: bool, min_time_minutes: int,
+                     subtitle: str = "", additional_info: str = "") -> list:
+    """Return the (filename, UTF-8 content) pairs that vary per package."""
+
+    course_id = sanitize_filename(course_title)
+
+    manifest = generate_manifest(course_id, course_title, mastery_score)
+    html = generate_html(course_title, course_url, primary_color,
+                        expected_duration, require_min_time, min_time_minutes,
+                        subtitle, additional_info)
+    return [('imsmanifest.xml', manifest), ('index.html', html)]
+
+def iter_scorm_package(course_title: str, course_url: str, primary_color: str,
+                       mastery_score: int, expected_duration: int,
+                       require_min_time: bool, min_time_minutes: int,
+                       subtitle: str = "", additional_info: str = "") -> Iterator[bytes]:
+    """Yield a SCORM 1.2 package as ZIP chunks, one batch per member as it is compressed."""
+
+    writer = _ChunkWriter()
+
+    # The writer is not seekable, so zipfile emits data descriptors instead of
+    # seeking back to patch each local header
+    with zipfile.ZipFile(writer, 'w') as zip_file:
+        _write_entry(zip_file, 'scormapi.js', _SCORM_API_BYTES)
+        yield from writer.drain()
+
+        for filename, content in _package_entries(course_title, course_url, primary_color,
+                                                  mastery_score, expected_duration,
+                                                  require_min_time, min_time_minutes,
+                                                  subtitle, additional_info):
+            _write_entry(zip_file, filename, content)
+            yield from writer.drain()
+
+    # Central directory is written on close
+    yield from writer.drain()
+
+def write_scorm_package(output: BinaryIO, course_title: str, course_url: str,
+                        primary_color: str, mastery_score: int, expected_duration: int,
+                        require_min_time: bool, min_time_minutes: int,
+                        subtitle: str = "", additional_info: str = "") -> None:
+    """Write a SCORM 1.2 package as a ZIP file to a writable binary file object."""
+    for chunk in iter_scorm_package(course_title, course_url, primary_color,
+                                    mastery_score, expected_duration, require_min_time,
+                                    min_time_minutes, subtitle, additional_info):
+        output.write(chunk)
+
+# cache_resource hands back the cached bytes object itself; cache_data would
+# unpickle a fresh copy of the archive on every hit. bytes are immutable, so
+# sharing them across sessions is safe.
+@st.cache_resource(max_entries=32, ttl=3600, show_spinner=False)
+def create_scorm_package(course_title: str, course_url: str, primary_color: str,
+                         mastery_score: int, expected_duration: int,
+                         require_min_time: bool, min_time_minutes: int,
+                         subtitle: str = "", additional_info: str = "") -> bytes:
+    """Create a SCORM 1.2 package as a ZIP file in memory."""
+
+    # Start from the prebuilt skeleton and append only the per-course entries;
+    # append mode rewrites the central directory but leaves scormapi.js untouched
+    zip_buffer = io.BytesIO(_BASE_ZIP_BYTES)
+    with zipfile.ZipFile(zip_buffer, 'a') as zip_file:
+        for filename, content in _package_entries(course_title, course_url, primary_color,
+                                                  mastery_score, expected_duration,
+                                                  require_min_time, min_time_minutes,
+                                                  subtitle, additional_info):
+            _write_entry(zip_file, filename, content)
+
+    return zip_buffer.getvalue()